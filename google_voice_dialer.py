@@ -20,228 +20,470 @@
 # Requirements: Python 3, pywin32 (for Windows-specific features)
 
 import argparse
-import datetime
+import atexit
+import collections
+import contextlib
+import functools
+import json
 import os
 import re
-import shutil
 import subprocess
 import sys
+import time
 import urllib.parse
-import webbrowser
 import winreg
 
-try:
-    import win32com.client as com_client
-except ImportError:
-    com_client = None
-
-try:
-    import win32api
-    import win32con
-except ImportError:
-    pass
-
 PROG_ID = "Google Voice Dialer"
 PROG_NAME = f"{PROG_ID}"
 PROG_DESC = "Google Voice tel: protocol handler. Dial phone numbers using Google Voice."
 LOG_FILENAME = f"{PROG_ID}.log"
+CACHE_FILENAME = "cache.json"
 VERSION = "1.1.1"
+CHROME_APP_PATHS_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\chrome.exe"
+
+# AppData locations, expanded once at startup
+_APPDATA = os.environ.get("APPDATA") or os.path.expandvars("%APPDATA%")
+_INSTALL_DIR = os.path.join(_APPDATA, PROG_ID)
+_START_MENU_DIR = os.path.join(_APPDATA, r"Microsoft\Windows\Start Menu\Programs")
+# Start Menu subfolders Chrome places app shortcuts in
+_CHROME_APPS_DIRS = tuple(
+    os.path.join(_START_MENU_DIR, name)
+    for name in ("Chrome Apps", "Google Chrome Apps")
+)
+
+# Dial log next to the running executable or script, resolved once at startup
+_BASE_DIR = (
+    os.path.dirname(sys.executable)
+    if getattr(sys, "frozen", False)
+    else os.path.dirname(os.path.abspath(__file__))
+)
+_LOG_PATH = os.path.join(_BASE_DIR, LOG_FILENAME)
+
+# Default per-user and per-machine Chrome install locations
+CHROME_INSTALL_PATHS = tuple(
+    os.path.join(os.environ[var], r"Google\Chrome\Application\chrome.exe")
+    for var in ("LOCALAPPDATA", "PROGRAMFILES", "PROGRAMFILES(X86)")
+    if os.environ.get(var)
+)
+
+ERROR_SUCCESS = 0
+ERROR_FILE_NOT_FOUND = 2
+
+_NON_DIGIT_RE = re.compile(r"\D")
+_APP_ID_RE = re.compile(r"--app-id=([a-z]{32})")
+
+# Launch Chrome fully detached, in its own process group, so the handler can exit immediately
+_LAUNCH_KW = dict(
+    creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+    close_fds=True,
+    stdin=subprocess.DEVNULL,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+)
+
+# Dial log file descriptor, opened on first write
+_log_fd = None
+
+# Resolved lookups from the cache file, read once on first use
+_CACHE = None
+
+# Translation table deleting every ASCII character except the digits 0-9
+_NON_DIGIT_DELETE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not "0" <= chr(c) <= "9")
+)
+
+
+@functools.lru_cache(maxsize=1)
+def get_com_client():
+    """Import win32com.client on first use; pywin32 is slow to load and only needed for shortcut lookups."""
+    try:
+        import win32com.client as com_client
+    except ImportError:
+        return None
+    return com_client
+
 
+@functools.lru_cache(maxsize=1)
+def get_wscript_shell():
+    """Dispatch WScript.Shell once and share it across shortcut lookups."""
+    return get_com_client().Dispatch("WScript.Shell")
 
+
+@functools.lru_cache(maxsize=1)
 def find_google_voice_shortcut():
     """Find the Google Voice shortcut path by searching in Start Menu Programs and subdirectories."""
-    if com_client is None:
+    if get_com_client() is None:
         return None
 
     try:
-        base_dir = os.path.expandvars(
-            r"%APPDATA%\Microsoft\Windows\Start Menu\Programs"
-        )
+        base_dir = _START_MENU_DIR
         if not os.path.exists(base_dir):
             return None
 
-        for root, dirs, files in os.walk(base_dir):
-            for file in files:
-                if file == "Google Voice.lnk":
-                    return os.path.join(root, file)
+        # Check the usual Chrome app shortcut locations before searching
+        for folder in (*_CHROME_APPS_DIRS, base_dir):
+            candidate = os.path.join(folder, "Google Voice.lnk")
+            if os.path.isfile(candidate):
+                return candidate
+
+        # Breadth-first scandir search; DirEntry reuses the directory listing's
+        # file attributes, so no per-entry stat is needed
+        pending = collections.deque([base_dir])
+        while pending:
+            try:
+                entries = os.scandir(pending.popleft())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name == "Google Voice.lnk":
+                        return entry.path
         return None
     except Exception as e:
         return None
 
 
-def get_google_voice_app_id():
-    """Dynamically find the app_id for Google Voice PWA from the shortcut."""
-    if com_client is None:
+@functools.lru_cache(maxsize=None)
+def _parse_shortcut(lnk_path):
+    """Read the shortcut properties the helpers need with one COM load, once per path."""
+    shortcut = get_wscript_shell().CreateShortCut(lnk_path)
+    arguments = shortcut.Arguments
+    match = _APP_ID_RE.search(arguments or "")
+    return {
+        "arguments": arguments,
+        "app_id": match.group(1) if match else None,
+        "icon_location": shortcut.IconLocation,
+    }
+
+
+def get_google_voice_app_id(lnk_path=None):
+    """Dynamically find the app_id for Google Voice PWA from the shortcut, searching for it if no path is given."""
+    if get_com_client() is None:
         print(
             "pywin32 not installed. Cannot dynamically lookup app_id. Install with 'pip install pywin32'."
         )
         return
 
-    lnk_path = find_google_voice_shortcut()
+    lnk_path = lnk_path or find_google_voice_shortcut()
     if not lnk_path:
         print("No Google Voice chrome app shortcut found.")
         return
 
     try:
-        shell = com_client.Dispatch("WScript.Shell")
-        shortcut = shell.CreateShortCut(lnk_path)
-        if not shortcut.Arguments:
+        shortcut = _parse_shortcut(lnk_path)
+        if not shortcut["arguments"]:
             print(f"No arguments found in {os.path.basename(lnk_path)}.")
             return
-        match = re.search(r"--app-id=([a-z]{32})", shortcut.Arguments)
-        if match:
-            return match.group(1)
+        return shortcut["app_id"]
     except Exception as e:
         print(f"Error finding Google Voice chrome app_id: {e}.")
         return
 
 
+def query_chrome_app_path():
+    """Find chrome.exe via the App Paths registry key in HKCU and HKLM."""
+    # HKCU\Software is shared between views; HKLM needs the 32-bit view for 32-bit installs
+    for root, view in (
+        (winreg.HKEY_CURRENT_USER, winreg.KEY_WOW64_64KEY),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_64KEY),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_32KEY),
+    ):
+        with contextlib.suppress(OSError), winreg.OpenKey(
+            root, CHROME_APP_PATHS_KEY, 0, winreg.KEY_READ | view
+        ) as key:
+            chrome_exe_path = winreg.QueryValueEx(key, None)[0]
+            if os.path.exists(chrome_exe_path):
+                return chrome_exe_path
+    return None
+
+
+def get_sibling_proxy_path(chrome_exe_path):
+    """Return the chrome_proxy.exe path in the same folder as chrome.exe."""
+    return os.path.join(os.path.dirname(chrome_exe_path), "chrome_proxy.exe")
+
+
+@functools.lru_cache(maxsize=1)
 def get_chrome_paths():
     """Find paths to chrome_proxy.exe and chrome.exe via registry and PATH."""
     proxy_path = None
     chrome_path = None
     try:
-        # Try HKCU and HKLM to find Chrome paths
-        paths = [
-            (
-                winreg.HKEY_CURRENT_USER,
-                r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\chrome.exe",
-            ),
-            (
-                winreg.HKEY_LOCAL_MACHINE,
-                r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\chrome.exe",
-            ),
-        ]
-        for root, subkey in paths:
-            try:
-                key = winreg.OpenKey(root, subkey)
-                chrome_exe_path = winreg.QueryValueEx(key, None)[0]
-                winreg.CloseKey(key)
-                if os.path.exists(chrome_exe_path):
-                    chrome_path = chrome_exe_path
-                    proxy_candidate = chrome_exe_path.replace(
-                        "chrome.exe", "chrome_proxy.exe"
-                    )
-                    if os.path.exists(proxy_candidate):
-                        proxy_path = proxy_candidate
-                    break
-            except OSError:
-                pass
-
-        # Fallback to PATH
-        if not proxy_path:
-            proxy_on_path = shutil.which("chrome_proxy.exe")
-            if proxy_on_path:
-                proxy_path = proxy_on_path
-        if not chrome_path:
-            chrome_on_path = shutil.which("chrome.exe")
-            if chrome_on_path:
-                chrome_path = chrome_on_path
+        # Check the default install locations, then the registry, before PATH
+        chrome_exe_path = (
+            next((path for path in CHROME_INSTALL_PATHS if os.path.exists(path)), None)
+            or query_chrome_app_path()
+        )
+        if chrome_exe_path:
+            # dial() launches chrome.exe directly, so the proxy is optional
+            proxy_candidate = get_sibling_proxy_path(chrome_exe_path)
+            if os.path.exists(proxy_candidate):
+                return proxy_candidate, chrome_exe_path
+            return None, chrome_exe_path
+
+        # Fallback to PATH, scanning for both executables concurrently
+        import concurrent.futures
+        import shutil
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            proxy_future = executor.submit(shutil.which, "chrome_proxy.exe")
+            chrome_future = executor.submit(shutil.which, "chrome.exe")
+            proxy_path = proxy_future.result()
+            chrome_path = chrome_future.result()
     except Exception as e:
         print(f"Error finding Chrome path: {e}")
     return proxy_path, chrome_path
 
 
-def get_google_voice_icon_location():
-    """Dynamically find the icon location for Google Voice PWA from the shortcut."""
-    if com_client is None:
+def get_google_voice_icon_location(lnk_path=None):
+    """Dynamically find the icon location for Google Voice PWA from the shortcut, searching for it if no path is given."""
+    if get_com_client() is None:
         return None
 
-    lnk_path = find_google_voice_shortcut()
+    lnk_path = lnk_path or find_google_voice_shortcut()
     if not lnk_path:
         return None
 
     try:
-        shell = com_client.Dispatch("WScript.Shell")
-        shortcut = shell.CreateShortCut(lnk_path)
-        icon_location = shortcut.IconLocation
-        if icon_location:
-            return icon_location
-        else:
-            return None
+        return _parse_shortcut(lnk_path)["icon_location"] or None
     except Exception as e:
         return None
 
 
-def register_handler(path: str = None):
-    """Register the handler for tel: protocol with capabilities for Windows 11."""
+def get_cache_path():
+    """Return the path of the cache file holding resolved Chrome and shortcut lookups."""
+    return os.path.join(_INSTALL_DIR, CACHE_FILENAME)
+
+
+def load_cache():
+    """Load previously resolved lookups from the cache file."""
     try:
-        # Determine the running file path (script or executable)
-        if path.lower().endswith(".exe"):
-            running_path = path
-            runner = ""
-        elif getattr(sys, "frozen", False):
-            running_path = sys.executable
-            runner = ""
-        else:
+        with open(get_cache_path(), "r", encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def save_cache(cache):
+    """Persist resolved lookups so later dials can skip discovery."""
+    try:
+        cache_path = get_cache_path()
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as cache_file:
+            json.dump(cache, cache_file)
+    except Exception:
+        pass
+
+
+def get_cache():
+    """Return the resolved lookups, reading the cache file at most once per process."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = load_cache()
+    return _CACHE
+
 
-            running_path = (
-                path if path.lower().endswith(".py") else os.path.abspath(__file__)
+def get_mtimes(paths):
+    """Return the mtime of each path, or None for paths that are unset or missing."""
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime if path else None)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
+
+
+def get_shortcut_token(lnk_path):
+    """Return mtimes identifying the shortcut, or the Start Menu folders a new one would appear in."""
+    if lnk_path:
+        return get_mtimes((lnk_path,))
+    return get_mtimes((_START_MENU_DIR, *_CHROME_APPS_DIRS))
+
+
+def resolve_launch_targets():
+    """Resolve Chrome paths and the Google Voice app_id, reusing the cache file while the shortcut is unchanged."""
+    global _CACHE
+    cache = get_cache()
+    proxy_path, chrome_path = cache.get("proxy_path"), cache.get("chrome_path")
+    # A cached entry always names chrome.exe; a failed Chrome lookup is never reused
+    if (
+        chrome_path
+        and "shortcut_token" in cache
+        and cache["shortcut_token"] == get_shortcut_token(cache.get("shortcut_path"))
+        and cache.get("chrome_token") == get_mtimes((proxy_path, chrome_path))
+    ):
+        return proxy_path, chrome_path, cache.get("app_id")
+
+    # Cache missing or stale: run full discovery
+    proxy_path, chrome_path = get_chrome_paths()
+    lnk_path = find_google_voice_shortcut()
+    app_id = get_google_voice_app_id(lnk_path)
+
+    # Without pywin32 the shortcut can't be read, so a miss says nothing. An
+    # unreadable app_id from an existing shortcut or an unresolved chrome.exe may
+    # be transient (both lookups swallow errors), so those are retried next dial
+    if get_com_client() is not None and (app_id or lnk_path is None) and chrome_path:
+        resolved = {
+            "shortcut_path": lnk_path,
+            "shortcut_token": get_shortcut_token(lnk_path),
+            "app_id": app_id,
+            "proxy_path": proxy_path,
+            "chrome_path": chrome_path,
+            "chrome_token": get_mtimes((proxy_path, chrome_path)),
+        }
+        # Only rewrite the file when discovery found something new
+        if resolved != cache:
+            _CACHE = resolved
+            save_cache(resolved)
+    return proxy_path, chrome_path, app_id
+
+
+def set_registry_values(base_key, registry_values):
+    """Write REG_SZ values directly, without a transaction."""
+    import ctypes
+    from ctypes import wintypes
+
+    # RegSetKeyValueW creates the key and sets the value in one call
+    try:
+        reg_set_key_value = ctypes.windll.advapi32.RegSetKeyValueW
+        reg_set_key_value.argtypes = [
+            wintypes.HKEY,
+            wintypes.LPCWSTR,
+            wintypes.LPCWSTR,
+            wintypes.DWORD,
+            wintypes.LPCVOID,
+            wintypes.DWORD,
+        ]
+        reg_set_key_value.restype = wintypes.LONG
+    except (AttributeError, OSError):
+        reg_set_key_value = None
+
+    for subkey, values in registry_values.items():
+        if reg_set_key_value is None:
+            with winreg.CreateKeyEx(base_key, subkey, 0, winreg.KEY_WRITE) as key:
+                for name, data in values.items():
+                    winreg.SetValueEx(key, name, 0, winreg.REG_SZ, data)
+            continue
+        for name, data in values.items():
+            buffer = ctypes.create_unicode_buffer(data)
+            result = reg_set_key_value(
+                base_key, subkey, name, winreg.REG_SZ, buffer, ctypes.sizeof(buffer)
             )
-            python_exe = sys.executable
-            # Use pythonw.exe to run without a console window
-            candidate = os.path.join(os.path.dirname(python_exe), "pythonw.exe")
-            runner = (
-                f'"{candidate}" ' if os.path.exists(candidate) else f'"{python_exe}" '
+            if result != ERROR_SUCCESS:
+                raise ctypes.WinError(result)
+
+
+def write_registry_values(registry_values):
+    """Write REG_SZ values under HKCU, in a single registry transaction when pywin32 is available."""
+    try:
+        import win32api
+        import win32con
+        import win32transaction
+    except ImportError:
+        win32transaction = None
+
+    base_key = winreg.HKEY_CURRENT_USER
+    if win32transaction is not None:
+        try:
+            # All writes commit together; closing an uncommitted transaction rolls it back
+            transaction = win32transaction.CreateTransaction(
+                Description=f"Register {PROG_ID}"
             )
+            try:
+                for subkey, values in registry_values.items():
+                    key, _ = win32api.RegCreateKeyEx(
+                        base_key, subkey, win32con.KEY_WRITE, Transaction=transaction
+                    )
+                    try:
+                        for name, data in values.items():
+                            win32api.RegSetValueEx(key, name, 0, win32con.REG_SZ, data)
+                    finally:
+                        key.Close()
+                win32transaction.CommitTransaction(transaction)
+            finally:
+                transaction.Close()
+            return
+        except Exception:
+            # Transacted registry access is deprecated and may be unavailable;
+            # nothing was committed, so redo the writes without it
+            pass
 
-        # Use HKCU for user-specific registration
-        base_key = winreg.HKEY_CURRENT_USER
+    set_registry_values(base_key, registry_values)
 
-        # Create ProgId under HKCU\Software\Classes\<PROG_ID>
-        classes_path = rf"Software\Classes\{PROG_ID}"
-        prog_id_key = winreg.CreateKeyEx(base_key, classes_path, 0, winreg.KEY_WRITE)
-        winreg.SetValueEx(prog_id_key, None, 0, winreg.REG_SZ, f"URL:{PROG_NAME}")
-        winreg.SetValueEx(prog_id_key, "URL Protocol", 0, winreg.REG_SZ, "")
-
-        # Optional: DefaultIcon (point to running_path for icon)
-        icon_key = winreg.CreateKeyEx(prog_id_key, "DefaultIcon", 0, winreg.KEY_WRITE)
-        winreg.SetValueEx(icon_key, None, 0, winreg.REG_SZ, f"{running_path},0")
-        winreg.CloseKey(icon_key)
-
-        # Create shell\open\command under ProgId
-        command_key = winreg.CreateKeyEx(
-            prog_id_key, r"shell\open\command", 0, winreg.KEY_WRITE
-        )
-        command_value = f'{runner}"{running_path}" "%1"'
-        winreg.SetValueEx(command_key, None, 0, winreg.REG_SZ, command_value)
-        winreg.CloseKey(command_key)
-        winreg.CloseKey(prog_id_key)
-
-        # Register capabilities under HKCU\Software\<PROG_ID>\Capabilities
-        cap_key = winreg.CreateKeyEx(
-            base_key, rf"Software\{PROG_ID}\Capabilities", 0, winreg.KEY_WRITE
-        )
-        winreg.SetValueEx(cap_key, "ApplicationName", 0, winreg.REG_SZ, PROG_NAME)
-        winreg.SetValueEx(
-            cap_key, "ApplicationDescription", 0, winreg.REG_SZ, PROG_DESC
-        )
-        # Optional: ApplicationIcon
-        winreg.SetValueEx(
-            cap_key, "ApplicationIcon", 0, winreg.REG_SZ, f"{running_path},0"
-        )
 
-        # URLAssociations
-        url_assoc_key = winreg.CreateKeyEx(
-            cap_key, "URLAssociations", 0, winreg.KEY_WRITE
-        )
-        winreg.SetValueEx(url_assoc_key, "tel", 0, winreg.REG_SZ, PROG_ID)
-        winreg.SetValueEx(url_assoc_key, "callto", 0, winreg.REG_SZ, PROG_ID)
-        winreg.CloseKey(url_assoc_key)
-        winreg.CloseKey(cap_key)
-
-        # Register the app in RegisteredApplications
-        reg_apps_key = winreg.CreateKeyEx(
-            base_key, r"Software\RegisteredApplications", 0, winreg.KEY_WRITE
-        )
-        winreg.SetValueEx(
-            reg_apps_key,
-            PROG_NAME,
-            0,
-            winreg.REG_SZ,
-            rf"Software\{PROG_ID}\Capabilities",
+def get_handler_command(path: str = None):
+    """Return the running file path and the shell open command that launches it."""
+    path = path or ""
+    # Determine the running file path (script or executable)
+    if path.lower().endswith(".exe"):
+        running_path = path
+        runner = ""
+    elif getattr(sys, "frozen", False):
+        running_path = sys.executable
+        runner = ""
+    else:
+
+        running_path = (
+            path if path.lower().endswith(".py") else os.path.abspath(__file__)
         )
-        winreg.CloseKey(reg_apps_key)
+        python_exe = sys.executable
+        # Use pythonw.exe to run without a console window
+        candidate = os.path.join(os.path.dirname(python_exe), "pythonw.exe")
+        runner = f'"{candidate}" ' if os.path.exists(candidate) else f'"{python_exe}" '
+
+    return running_path, f'{runner}"{running_path}" "%1"'
+
+
+def is_registration_current(registry_values):
+    """Check whether every value in registry_values is already present under HKCU."""
+    try:
+        for subkey, values in registry_values.items():
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey) as key:
+                for name, data in values.items():
+                    if winreg.QueryValueEx(key, name)[0] != data:
+                        return False
+    except OSError:
+        return False
+    return True
+
+
+def register_handler(path: str = None):
+    """Register the handler for tel: protocol with capabilities for Windows 11."""
+    try:
+        running_path, command_value = get_handler_command(path)
+        classes_path = rf"Software\Classes\{PROG_ID}"
+        capabilities_path = rf"Software\{PROG_ID}\Capabilities"
+
+        # Registry values to write under HKCU, grouped by key
+        registry_values = {
+            # ProgId under HKCU\Software\Classes\<PROG_ID>
+            classes_path: {None: f"URL:{PROG_NAME}", "URL Protocol": ""},
+            # Optional: DefaultIcon (point to running_path for icon)
+            rf"{classes_path}\DefaultIcon": {None: f"{running_path},0"},
+            # Capabilities under HKCU\Software\<PROG_ID>\Capabilities
+            capabilities_path: {
+                "ApplicationName": PROG_NAME,
+                "ApplicationDescription": PROG_DESC,
+                "ApplicationIcon": f"{running_path},0",
+            },
+            rf"{capabilities_path}\URLAssociations": {
+                "tel": PROG_ID,
+                "callto": PROG_ID,
+            },
+            # Register the app in RegisteredApplications
+            r"Software\RegisteredApplications": {PROG_NAME: capabilities_path},
+            # Open command last, so a non-transacted write that stops partway
+            # never points TEL links at a half-registered handler
+            rf"{classes_path}\shell\open\command": {None: command_value},
+        }
+        # Reads instead of rewriting every key when nothing has changed
+        if is_registration_current(registry_values):
+            print(f"'{PROG_ID}' tel: protocol handler is already registered.")
+            return
+        write_registry_values(registry_values)
 
         print(f"Successfully registered '{PROG_ID}' tel: protocol handler.")
         print(
@@ -255,46 +497,118 @@ def register_handler(path: str = None):
         print(f"Error registering: {e}")
 
 
-def unregister_handler(prog_id=PROG_ID, prog_name=PROG_NAME):
-    """Unregister the tel: protocol handler and capabilities."""
+def delete_key_recursive(root, path):
+    """Delete path and all subkeys under root, natively via RegDeleteTreeW."""
+    import ctypes
+    from ctypes import wintypes
+
     try:
+        reg_delete_tree = ctypes.windll.advapi32.RegDeleteTreeW
+        reg_delete_tree.argtypes = [wintypes.HKEY, wintypes.LPCWSTR]
+        reg_delete_tree.restype = wintypes.LONG
+        if reg_delete_tree(root, path) in (ERROR_SUCCESS, ERROR_FILE_NOT_FOUND):
+            return
+    except (AttributeError, OSError):
+        pass
 
-        def delete_key_recursive(root, path):
-            # Deletes path and all subkeys under root using stable full paths
+    # Fall back to a post-order walk with an explicit stack: each key's children
+    # are enumerated once, and the key is deleted when revisited after them
+    stack = [(path, False)]
+    while stack:
+        current, children_done = stack.pop()
+        if children_done:
             try:
-                with winreg.OpenKey(root, path, 0, winreg.KEY_ALL_ACCESS) as key:
-                    while True:
-                        sub = winreg.EnumKey(key, 0)
-                        delete_key_recursive(root, path + "\\" + sub)
-            except OSError:
-                pass
-            try:
-                winreg.DeleteKey(root, path)
+                winreg.DeleteKey(root, current)
             except FileNotFoundError:
                 pass
+            continue
+        try:
+            with winreg.OpenKey(root, current, 0, winreg.KEY_READ) as key:
+                subkey_count = winreg.QueryInfoKey(key)[0]
+                subkeys = [winreg.EnumKey(key, i) for i in range(subkey_count)]
+        except OSError:
+            subkeys = []
+        stack.append((current, True))
+        stack.extend((current + "\\" + sub, False) for sub in subkeys)
+
+
+def remove_registry_entries(base_key, key_paths, values):
+    """Delete key trees and values directly, without a transaction."""
+    for path in key_paths:
+        delete_key_recursive(base_key, path)
+    for subkey, name in values:
+        try:
+            with winreg.OpenKey(base_key, subkey, 0, winreg.KEY_ALL_ACCESS) as key:
+                winreg.DeleteValue(key, name)
+        except OSError:
+            pass
 
-        # Delete ProgId from HKCU\Software\Classes\<PROG_ID>
-        delete_key_recursive(winreg.HKEY_CURRENT_USER, rf"Software\Classes\{prog_id}")
 
-        # Delete capabilities from HKCU\Software\<PROG_ID>
-        delete_key_recursive(winreg.HKEY_CURRENT_USER, rf"Software\{prog_id}")
+def delete_registry_entries(key_paths, values):
+    """Delete key trees and values under HKCU, in a single registry transaction when pywin32 is available."""
+    try:
+        import pywintypes
+        import win32api
+        import win32con
+        import win32transaction
+    except ImportError:
+        win32transaction = None
+
+    base_key = winreg.HKEY_CURRENT_USER
+    if win32transaction is not None:
+        # Each operation deletes a named child (subkey tree or value) of an open key
+        operations = []
+        for path in key_paths:
+            parent, _, name = path.rpartition("\\")
+            operations.append((parent, name, win32api.RegDeleteTree))
+        for subkey, name in values:
+            operations.append((subkey, name, win32api.RegDeleteValue))
 
-        # Remove from RegisteredApplications
         try:
-            reg_apps_key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                r"Software\RegisteredApplications",
-                0,
-                winreg.KEY_ALL_ACCESS,
+            # All deletes commit together; closing an uncommitted transaction rolls it back
+            transaction = win32transaction.CreateTransaction(
+                Description=f"Unregister {PROG_ID}"
             )
             try:
-                winreg.DeleteValue(reg_apps_key, prog_name)
-            except FileNotFoundError:
-                pass
-            winreg.CloseKey(reg_apps_key)
-        except OSError:
+                for subkey, name, delete in operations:
+                    try:
+                        key = win32api.RegOpenKeyTransacted(
+                            base_key, subkey, win32con.KEY_ALL_ACCESS, transaction
+                        )
+                        try:
+                            delete(key, name)
+                        finally:
+                            key.Close()
+                    except pywintypes.error as e:
+                        # Already removed
+                        if e.winerror != ERROR_FILE_NOT_FOUND:
+                            raise
+                win32transaction.CommitTransaction(transaction)
+            finally:
+                transaction.Close()
+            return
+        except Exception:
+            # Transacted registry access is deprecated and may be unavailable;
+            # nothing was committed, so redo the deletes without it
             pass
 
+    remove_registry_entries(base_key, key_paths, values)
+
+
+def unregister_handler(prog_id=PROG_ID, prog_name=PROG_NAME):
+    """Unregister the tel: protocol handler and capabilities."""
+    try:
+        delete_registry_entries(
+            [
+                # ProgId from HKCU\Software\Classes\<PROG_ID>
+                rf"Software\Classes\{prog_id}",
+                # Capabilities from HKCU\Software\<PROG_ID>
+                rf"Software\{prog_id}",
+            ],
+            # Entry in RegisteredApplications
+            [(r"Software\RegisteredApplications", prog_name)],
+        )
+
         print(f"Successfully unregistered '{prog_id}' tel: protocol handler.")
     except PermissionError:
         print("Permission denied: Run the script as Administrator to unregister.")
@@ -302,19 +616,52 @@ def unregister_handler(prog_id=PROG_ID, prog_name=PROG_NAME):
         print(f"Error unregistering: {e}")
 
 
+def copy_file(source, target):
+    """Copy a file with the native CopyFileW, overwriting the target."""
+    import ctypes
+    from ctypes import wintypes
+
+    copy_file_w = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileW
+    copy_file_w.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL]
+    copy_file_w.restype = wintypes.BOOL
+    if not copy_file_w(source, target, False):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def copy_file_if_changed(source, target):
+    """Copy source over target unless it already matches by size and mtime; return True if copied."""
+    try:
+        source_stat = os.stat(source)
+        target_stat = os.stat(target)
+        if (source_stat.st_size, source_stat.st_mtime_ns) == (
+            target_stat.st_size,
+            target_stat.st_mtime_ns,
+        ):
+            print("Installed copy is already up to date.")
+            return False
+    except OSError:
+        pass
+    copy_file(source, target)
+    return True
+
+
 def install():
     try:
-        appdata_dir = os.path.expandvars(rf"%APPDATA%\{PROG_ID}")
+        appdata_dir = _INSTALL_DIR
         os.makedirs(appdata_dir, exist_ok=True)
         target_exe = os.path.join(appdata_dir, PROG_ID + ".exe")
         target_py = os.path.join(appdata_dir, "google_voice_dialer.py")
 
+        # Forget resolved lookups from any previous install
+        with contextlib.suppress(OSError):
+            os.remove(get_cache_path())
+
         if getattr(sys, "frozen", False):
             # Running as executable, copy self to appdata
             source = sys.executable
             target = target_exe
             if os.path.abspath(source) != os.path.abspath(target):
-                shutil.copy(source, target)
+                copy_file_if_changed(source, target)
             else:
                 print("Already installed in AppData.")
             install_path = target
@@ -323,15 +670,15 @@ def install():
             source = os.path.abspath(__file__)
             target = target_py
             if os.path.abspath(source) != os.path.abspath(target):
-                shutil.copy(source, target)
+                copy_file_if_changed(source, target)
             else:
                 print("Already installed in AppData.")
             install_path = target
 
-        # Register the copied file
+        # Register the copied file; skipped when it is already registered
         if os.path.exists(install_path):
             register_handler(path=install_path)
-            subprocess.call(["start", "ms-settings:defaultapps"], shell=True)
+            os.startfile("ms-settings:defaultapps")
         else:
             print("File not found at expected path.")
 
@@ -341,20 +688,35 @@ def install():
 
 def uninstall():
     unregister_handler()
-    appdata_dir = os.path.expandvars(rf"%APPDATA%\{PROG_ID}")
+    appdata_dir = _INSTALL_DIR
     if os.path.exists(appdata_dir):
+        import shutil
+
         shutil.rmtree(appdata_dir)
     print("Uninstalled successfully.")
 
 
+def write_log(line):
+    """Append a line to the dial log with a single write on a descriptor kept open until exit."""
+    global _log_fd
+    if _log_fd is None:
+        _log_fd = os.open(_LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        atexit.register(os.close, _log_fd)
+    os.write(_log_fd, line.encode("utf-8"))
+
+
 def dial(phone_url):
     """Handle dialing via Google Voice."""
-    if not (
-        phone_url.lower().startswith("tel:") or phone_url.lower().startswith("callto:")
-    ):
+    # Only the 7-character prefix is needed to classify and strip the scheme
+    head = phone_url[:7].lower()
+    if head.startswith("tel:"):
+        phone = phone_url[4:]
+    elif head.startswith("callto:"):
+        phone = phone_url[7:]
+    else:
         return
     # Extract and clean phone number (preserve single leading +, strip non-digits)
-    phone = re.sub(r"^(tel|callto):", "", phone_url, flags=re.IGNORECASE).strip()
+    phone = phone.strip()
     phone = urllib.parse.unquote(phone)
 
     # Strip everything after the first , or #
@@ -370,45 +732,55 @@ def dial(phone_url):
         phone = phone[:idx].strip()
 
     plus = "+" if phone.startswith("+") else ""
-    digits = re.sub(r"\D", "", phone)
+    if phone.isascii():
+        digits = phone.translate(_NON_DIGIT_DELETE)
+    else:
+        digits = _NON_DIGIT_RE.sub("", phone)
+    if not digits:
+        # Nothing left to dial (e.g. "tel:" or "tel:+"), so skip the lookup and launch
+        return
     phone = plus + digits
 
     # Log the dial attempt
     try:
-        base_dir = (
-            os.path.dirname(sys.executable)
-            if getattr(sys, "frozen", False)
-            else os.path.dirname(os.path.abspath(__file__))
-        )
-        log_path = os.path.join(base_dir, LOG_FILENAME)
-        with open(log_path, "a", encoding="utf-8") as log_file:
-            log_file.write(f"{datetime.datetime.now()} - {phone}\n")
+        write_log(f"{time.strftime('%Y-%m-%d %H:%M:%S')} - {phone}\n")
     except Exception:
         pass
 
-    # Encode for URL
-    encoded_phone = urllib.parse.quote(phone)
+    # Encode for URL; ASCII digits are URL-safe, so only the leading + needs escaping
+    if phone.isascii():
+        encoded_phone = phone.replace("+", "%2B")
+    else:
+        encoded_phone = urllib.parse.quote(phone)
 
     # Google Voice dialing URL
     gv_url = f"https://voice.google.com/u/0/calls?a=nc,{encoded_phone}"
 
-    # Dynamically get Chrome proxy path and app_id
-    proxy_path, chrome_path = get_chrome_paths()
-    app_id = get_google_voice_app_id()
+    # Get Chrome proxy path and app_id, from the cache when still valid
+    proxy_path, chrome_path, app_id = resolve_launch_targets()
 
-    if proxy_path and app_id:
-        subprocess.run(
+    # Launch without waiting; the handler has nothing left to do afterwards
+    if app_id and (chrome_path or proxy_path):
+        # chrome_proxy.exe only forwards these arguments to chrome.exe, so call
+        # chrome.exe directly when it is known
+        subprocess.Popen(
             [
-                proxy_path,
+                chrome_path or proxy_path,
                 f"--app-id={app_id}",
                 f"--app-launch-url-for-shortcuts-menu-item={gv_url}",
             ],
-            check=False,
+            **_LAUNCH_KW,
         )
     elif chrome_path:
-        subprocess.run([chrome_path, f"--app={gv_url}"], check=False)
+        subprocess.Popen([chrome_path, f"--app={gv_url}"], **_LAUNCH_KW)
     else:
-        webbrowser.open(gv_url)
+        # ShellExecute opens the default browser without importing webbrowser
+        try:
+            os.startfile(gv_url)
+        except OSError:
+            import webbrowser
+
+            webbrowser.open(gv_url)
 
 
 def main():
@@ -425,6 +797,11 @@ def main():
     parser.add_argument(
         "--unregister", action="store_true", help="unregister handler for TEL links"
     )
+    parser.add_argument(
+        "--dial-many",
+        metavar="FILE",
+        help="dial each tel: URL listed one per line in FILE",
+    )
     parser.add_argument("url", nargs="?", help="tel: URL to dial")
 
     args = parser.parse_args()
@@ -437,11 +814,21 @@ def main():
         register_handler()
     elif args.unregister:
         unregister_handler()
+    elif args.dial_many:
+        # One process for the batch, so lookups and the log handle are shared
+        with open(args.dial_many, encoding="utf-8-sig") as url_file:
+            for line in url_file:
+                url = line.strip()
+                if url:
+                    dial(url)
     elif args.url:
         dial(args.url)
     else:
         help_text = parser.format_help()
         if getattr(sys, "frozen", False):
+            import win32api
+            import win32con
+
             win32api.MessageBox(
                 0,
                 help_text,